@@ -43,7 +43,8 @@ def main() -> None:
         bkmrklet_collection = ConversationSet.from_json(bkmrklet_json)
         entire_collection.update(bkmrklet_collection)
 
-    output_folder = Path(user.configs["output_folder"])
+    # resolved once, so every folder derived from it is absolute (for `as_uri`)
+    output_folder = Path(user.configs["output_folder"]).resolve()
 
     # overwrite the output folder if it already exists (might change this in the future)
     if output_folder.exists() and output_folder.is_dir():
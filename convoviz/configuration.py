@@ -2,18 +2,9 @@
 
 from __future__ import annotations
 
-from questionary import (
-    Choice,
-    Style,
-    checkbox,
-    select,
-)
-from questionary import (
-    path as qst_path,
-)
-from questionary import (
-    text as qst_text,
-)
+from contextlib import suppress
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 from .models import Conversation, Message
 from .utils import (
@@ -21,25 +12,56 @@ from .utils import (
     colormaps,
     font_names,
     font_path,
+    latest_zip,
     stem,
     validate_header,
     validate_zip,
 )
 
-CUSTOM_STYLE = Style(
-    [
-        ("qmark", "fg:#34eb9b bold"),
-        ("question", "bold fg:#e0e0e0"),
-        ("answer", "fg:#34ebeb bold"),
-        ("pointer", "fg:#e834eb bold"),
-        ("highlighted", "fg:#349ceb bold"),
-        ("selected", "fg:#34ebeb"),
-        ("separator", "fg:#eb3434"),
-        ("instruction", "fg:#eb9434"),
-        ("text", "fg:#b2eb34"),
-        ("disabled", "fg:#858585 italic"),
-    ],
-)
+if TYPE_CHECKING:
+    from questionary import Style
+
+# `questionary` (and `prompt_toolkit` under it) is only imported once the user
+# is actually prompted, so importing convoviz doesn't pay for it
+
+
+@cache
+def _custom_style() -> Style:
+    """Style of the prompts, built on first use."""
+    from questionary import Style
+
+    return Style(
+        [
+            ("qmark", "fg:#34eb9b bold"),
+            ("question", "bold fg:#e0e0e0"),
+            ("answer", "fg:#34ebeb bold"),
+            ("pointer", "fg:#e834eb bold"),
+            ("highlighted", "fg:#349ceb bold"),
+            ("selected", "fg:#34ebeb"),
+            ("separator", "fg:#eb3434"),
+            ("instruction", "fg:#eb9434"),
+            ("text", "fg:#b2eb34"),
+            ("disabled", "fg:#858585 italic"),
+        ],
+    )
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Build `CUSTOM_STYLE` lazily (PEP 562)."""
+    if name == "CUSTOM_STYLE":
+        return _custom_style()
+    err_msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(err_msg)
+
+
+def _zip_validator(text: str) -> bool | str:
+    """Validate the zip path prompt, with an error message for questionary."""
+    return validate_zip(text) or "Must be a zip file containing 'conversations.json'"
+
+
+def _header_validator(text: str) -> bool | str:
+    """Validate the message header prompts, with an error message for questionary."""
+    return validate_header(text) or "Must be a valid markdown header (e.g. '# Me')"
 
 
 class UserConfigs:
@@ -49,75 +71,114 @@ class UserConfigs:
         """Initialize UserConfigs object."""
         self.configs = DEFAULT_USER_CONFIGS.copy()
 
+        if not self.configs["zip_filepath"]:
+            # no zip in Downloads: no default, the user is asked for the path anyway
+            with suppress(FileNotFoundError):
+                self.configs["zip_filepath"] = str(latest_zip())
+
         # will implement a way to read from a config file later ...
 
     def prompt(self) -> None:
         """Prompt the user for input and update the configs."""
+        from questionary import (
+            Choice,
+            checkbox,
+            form,
+            path as qst_path,
+            select,
+            text as qst_text,
+        )
+
+        custom_style = _custom_style()
         lookup = self.configs
 
-        lookup["zip_filepath"] = qst_path(
-            "Enter the path to the zip file :",
-            lookup["zip_filepath"],
-            validate=validate_zip,
-            style=CUSTOM_STYLE,
-        ).ask()
-
-        lookup["output_folder"] = qst_path(
-            "Enter the path to the output folder :",
-            lookup["output_folder"],
-            style=CUSTOM_STYLE,
-        ).ask()
-
-        for author_role in lookup["message"]["author_headers"]:
-            lookup["message"]["author_headers"][author_role] = qst_text(
+        header_questions = {
+            f"header_{author_role}": qst_text(
                 f"Enter the message header (#) for messages from '{author_role}' :",
-                lookup["message"]["author_headers"][author_role],
-                validate=validate_header,
-                style=CUSTOM_STYLE,
-            ).ask()
-
-        lookup["conversation"]["markdown"]["latex_delimiters"] = select(
-            "Select the LaTeX math delimiters you want to use :",
-            ["default", "dollars"],
-            lookup["conversation"]["markdown"]["latex_delimiters"],
-            style=CUSTOM_STYLE,
-        ).ask()
+                header,
+                validate=_header_validator,
+                style=custom_style,
+            )
+            for author_role, header in lookup["message"]["author_headers"].items()
+        }
 
         yaml_choices = [
             Choice(title=header, checked=value)
             for header, value in lookup["conversation"]["yaml"].items()
         ]
 
-        selected_headers = checkbox(
-            "Select the YAML metadata headers you want to include :",
-            yaml_choices,
-            style=CUSTOM_STYLE,
-        ).ask()
+        # none of the questions depend on a previous answer, so they can all be
+        # asked in a single form instead of one prompt session per question.
+        # `unsafe_ask` lets Ctrl-C raise KeyboardInterrupt (`ask` would return `{}`)
+        answers = form(
+            zip_filepath=qst_path(
+                "Enter the path to the zip file :",
+                lookup["zip_filepath"],
+                validate=_zip_validator,
+                validate_while_typing=False,
+                style=custom_style,
+            ),
+            output_folder=qst_path(
+                "Enter the path to the output folder :",
+                lookup["output_folder"],
+                style=custom_style,
+            ),
+            **header_questions,
+            latex_delimiters=select(
+                "Select the LaTeX math delimiters you want to use :",
+                ["default", "dollars"],
+                lookup["conversation"]["markdown"]["latex_delimiters"],
+                style=custom_style,
+            ),
+            yaml_headers=checkbox(
+                "Select the YAML metadata headers you want to include :",
+                yaml_choices,
+                style=custom_style,
+            ),
+            font_name=select(
+                "Select the font you want to use for the word clouds :",
+                font_names(),
+                stem(lookup["wordcloud"].get("font_path") or ""),
+                style=custom_style,
+            ),
+            colormap=select(
+                "Select the color theme you want to use for the word clouds :",
+                colormaps(),
+                lookup["wordcloud"].get("colormap"),
+                style=custom_style,
+            ),
+            custom_stopwords=qst_text(
+                "Enter custom stopwords (separated by commas) :",
+                lookup["wordcloud"].get("custom_stopwords", ""),
+                style=custom_style,
+            ),
+        ).unsafe_ask()
+
+        lookup["zip_filepath"] = answers["zip_filepath"]
+        lookup["output_folder"] = answers["output_folder"]
 
-        for header in lookup["conversation"]["yaml"]:
-            lookup["conversation"]["yaml"][header] = header in selected_headers
+        for author_role in lookup["message"]["author_headers"]:
+            lookup["message"]["author_headers"][author_role] = answers[
+                f"header_{author_role}"
+            ]
+
+        lookup["conversation"]["markdown"]["latex_delimiters"] = answers[
+            "latex_delimiters"
+        ]
 
-        font_name: str = select(
-            "Select the font you want to use for the word clouds :",
-            font_names(),
-            stem(lookup["wordcloud"].get("font_path") or ""),
-            style=CUSTOM_STYLE,
-        ).ask()
+        selected_headers = set(answers["yaml_headers"])
+        yaml_config = lookup["conversation"]["yaml"]
+
+        for header in yaml_config:
+            yaml_config[header] = header in selected_headers
+
+        font_name: str = answers["font_name"]
 
         lookup["wordcloud"]["font_path"] = str(font_path(font_name))
 
-        lookup["wordcloud"]["colormap"] = select(
-            "Select the color theme you want to use for the word clouds :",
-            colormaps(),
-            lookup["wordcloud"].get("colormap"),
-            style=CUSTOM_STYLE,
-        ).ask()
-
-        lookup["wordcloud"]["custom_stopwords"] = qst_text(
-            "Enter custom stopwords (separated by commas) :",
-            lookup["wordcloud"].get("custom_stopwords", ""),
-            style=CUSTOM_STYLE,
-        ).ask()
+        lookup["wordcloud"]["colormap"] = answers["colormap"]
+
+        lookup["wordcloud"]["custom_stopwords"] = answers["custom_stopwords"]
 
     def set_model_configs(self) -> None:
         """Set the configuration for all models."""
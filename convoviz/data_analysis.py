@@ -7,8 +7,7 @@ Should ideally only return matplotlib objects, and not deal with the filesystem.
 
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime, timezone
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING
 
 from matplotlib.figure import Figure
@@ -25,6 +24,8 @@ if TYPE_CHECKING:
 
     from .utils import GraphKwargs, WordCloudKwargs
 
+_SECONDS_PER_DAY = 86400.0
+
 
 def generate_week_barplot(
     timestamps: list[float],
@@ -32,9 +33,6 @@ def generate_week_barplot(
     **kwargs: Unpack[GraphKwargs],
 ) -> Figure:
     """Create a bar graph from the given timestamps, collapsed on one week."""
-    dates = [datetime.fromtimestamp(ts, timezone.utc) for ts in timestamps]
-
-    weekday_counts: defaultdict[str, int] = defaultdict(int)
     days = [
         "Monday",
         "Tuesday",
@@ -45,11 +43,14 @@ def generate_week_barplot(
         "Sunday",
     ]
 
-    for date in dates:
-        weekday_counts[days[date.weekday()]] += 1
+    # the epoch (1970-01-01, UTC) was a Thursday, so the weekday index can be
+    # computed directly from the timestamp, without building datetime objects
+    weekday_counts = [0] * 7
+    for ts in timestamps:
+        weekday_counts[(int(ts // _SECONDS_PER_DAY) + 3) % 7] += 1
 
     x = days
-    y = [weekday_counts[day] for day in days]
+    y = weekday_counts
 
     fig = Figure(dpi=300)
     ax = fig.add_subplot()
@@ -68,7 +69,8 @@ def generate_week_barplot(
 
 
 # Ensure that the stopwords are downloaded
-def _load_nltk_stopwords() -> set[str]:
+@cache
+def _load_nltk_stopwords() -> frozenset[str]:
     """Load nltk stopwords."""
     try:
         nltk_find("corpora/stopwords")
@@ -84,7 +86,34 @@ def _load_nltk_stopwords() -> set[str]:
         "portuguese",
     ]  # add more languages here ...
 
-    return {word for lang in languages for word in nltk_stopwords.words(fileids=lang)}
+    return frozenset(
+        word for lang in languages for word in nltk_stopwords.words(fileids=lang)
+    )
+
+
+@lru_cache(maxsize=8)
+def _wordcloud(  # noqa: PLR0913
+    font_path: str | None,
+    width: int,
+    height: int,
+    stopwords: frozenset[str],
+    background_color: str | None,
+    mode: str,
+    colormap: str | None,
+    *,
+    include_numbers: bool,
+) -> WordCloud:
+    """Build a `WordCloud` for the given configs, reused across `generate` calls."""
+    return WordCloud(
+        font_path=font_path,
+        width=width,
+        height=height,
+        stopwords=stopwords,
+        background_color=background_color,
+        mode=mode,
+        colormap=colormap,
+        include_numbers=include_numbers,
+    )
 
 
 def generate_wordcloud(
@@ -103,16 +132,16 @@ def generate_wordcloud(
         word.strip().lower() for word in custom_stopwords_list if word.strip()
     ]
 
-    stopwords = nltk_stopwords.union(set(custom_stopwords_list))
+    stopwords = nltk_stopwords.union(custom_stopwords_list)
 
-    wordcloud = WordCloud(
-        font_path=configs.get("font_path"),
-        width=configs.get("width"),  # pyright: ignore[reportGeneralTypeIssues]
-        height=configs.get("height"),  # pyright: ignore[reportGeneralTypeIssues]
-        stopwords=stopwords,  # pyright: ignore[reportGeneralTypeIssues]
-        background_color=configs.get("background_color"),  # pyright: ignore[reportGeneralTypeIssues]
-        mode=configs.get("mode"),  # pyright: ignore[reportGeneralTypeIssues]
-        colormap=configs.get("colormap"),
+    wordcloud = _wordcloud(
+        configs.get("font_path"),
+        configs.get("width"),  # pyright: ignore[reportGeneralTypeIssues]
+        configs.get("height"),  # pyright: ignore[reportGeneralTypeIssues]
+        stopwords,
+        configs.get("background_color"),
+        configs.get("mode"),  # pyright: ignore[reportGeneralTypeIssues]
+        configs.get("colormap"),
         include_numbers=configs.get("include_numbers"),  # pyright: ignore[reportGeneralTypeIssues]
     ).generate(text)
 
@@ -2,17 +2,42 @@
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from os import cpu_count
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from tqdm import tqdm
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from typing_extensions import Unpack
 
     from .models import ConversationSet
     from .utils import GraphKwargs, WordCloudKwargs
 
+_MAX_SAVE_WORKERS = cpu_count() or 1
+# rendered images waiting to be saved are held in memory, so only this many at once
+_MAX_PENDING_SAVES = 2 * _MAX_SAVE_WORKERS
+_PROGRESS_MININTERVAL = 0.25  # seconds between progress bar refreshes
+
+
+def _submit_save(
+    executor: ThreadPoolExecutor,
+    pending: set[Future[None]],
+    save: Callable[..., None],
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> None:
+    """Submit the save to the executor, once there's room among the pending ones."""
+    if len(pending) >= _MAX_PENDING_SAVES:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        pending.difference_update(done)
+        for future in done:
+            future.result()  # re-raise any exception from the worker
+    pending.add(executor.submit(save, *args, **kwargs))
+
 
 def generate_week_barplots(
     conv_set: ConversationSet,
@@ -21,31 +46,46 @@ def generate_week_barplots(
     progress_bar: bool = False,
     **kwargs: Unpack[GraphKwargs],
 ) -> None:
-    """Create the weekwise graphs and save them to the folder."""
+    """Create the weekwise graphs and save them to the folder.
+
+    The figures are created here, and drawn and written to PNG files in threads
+    (the PNG encoding releases the GIL).
+    """
     dir_path = Path(dir_path)
 
-    month_groups = conv_set.group_by_month()
-    year_groups = conv_set.group_by_year()
-
-    for month in tqdm(
-        month_groups.keys(),
-        "Creating monthly weekwise graphs 📈 ",
-        disable=not progress_bar,
-    ):
-        title = month.strftime("%B '%y")
-        month_groups[month].week_barplot(title, **kwargs).savefig(  # pyright: ignore [reportUnknownMemberType]
-            dir_path / f"{month.strftime('%Y %B')}.png",
-        )
-
-    for year in tqdm(
-        year_groups.keys(),
-        "Creating yearly weekwise graphs 📈 ",
-        disable=not progress_bar,
-    ):
-        title = year.strftime("%Y")
-        year_groups[year].week_barplot(title, **kwargs).savefig(  # pyright: ignore [reportUnknownMemberType]
-            dir_path / f"{year.strftime('%Y')}.png",
-        )
+    # titles and file paths computed upfront, so the loops only render and submit
+    monthly = [
+        (group, month.strftime("%B '%y"), dir_path / f"{month.strftime('%Y %B')}.png")
+        for month, group in conv_set.group_by_month().items()
+    ]
+    yearly = [
+        (group, year.strftime("%Y"), dir_path / f"{year.strftime('%Y')}.png")
+        for year, group in conv_set.group_by_year().items()
+    ]
+
+    pending: set[Future[None]] = set()
+    with ThreadPoolExecutor(max_workers=_MAX_SAVE_WORKERS) as executor:
+        for tasks, description in (
+            (monthly, "Creating monthly weekwise graphs 📈 "),
+            (yearly, "Creating yearly weekwise graphs 📈 "),
+        ):
+            with tqdm(
+                total=len(tasks),
+                desc=description,
+                disable=not progress_bar,
+                mininterval=_PROGRESS_MININTERVAL,
+            ) as pbar:
+                for group, title, filepath in tasks:
+                    _submit_save(
+                        executor,
+                        pending,
+                        group.week_barplot(title, **kwargs).savefig,  # pyright: ignore [reportUnknownMemberType]
+                        filepath,
+                    )
+                    pbar.update(1)
+
+    for future in pending:
+        future.result()
 
 
 def generate_wordclouds(
@@ -55,39 +95,49 @@ def generate_wordclouds(
     progress_bar: bool = False,
     **kwargs: Unpack[WordCloudKwargs],
 ) -> None:
-    """Create the wordclouds and save them to the folder."""
+    """Create the wordclouds and save them to the folder.
+
+    The wordclouds are generated here (the `WordCloud` objects are cached and
+    shared), and written to PNG files in threads.
+    """
     dir_path = Path(dir_path)
 
-    week_groups = conv_set.group_by_week()
-    month_groups = conv_set.group_by_month()
-    year_groups = conv_set.group_by_year()
-
-    for week in tqdm(
-        week_groups.keys(),
-        "Creating weekly wordclouds 🔡☁️ ",
-        disable=not progress_bar,
-    ):
-        week_groups[week].wordcloud(**kwargs).save(
-            dir_path / f"{week.strftime('%Y week %W')}.png",
-            optimize=True,
-        )
-
-    for month in tqdm(
-        month_groups.keys(),
-        "Creating monthly wordclouds 🔡☁️ ",
-        disable=not progress_bar,
-    ):
-        month_groups[month].wordcloud(**kwargs).save(
-            dir_path / f"{month.strftime('%Y %B')}.png",
-            optimize=True,
-        )
-
-    for year in tqdm(
-        year_groups.keys(),
-        "Creating yearly wordclouds 🔡☁️ ",
-        disable=not progress_bar,
-    ):
-        year_groups[year].wordcloud(**kwargs).save(
-            dir_path / f"{year.strftime('%Y')}.png",
-            optimize=True,
-        )
+    # file paths computed upfront, so the loops only render and submit
+    weekly = [
+        (group, dir_path / f"{week.strftime('%Y week %W')}.png")
+        for week, group in conv_set.group_by_week().items()
+    ]
+    monthly = [
+        (group, dir_path / f"{month.strftime('%Y %B')}.png")
+        for month, group in conv_set.group_by_month().items()
+    ]
+    yearly = [
+        (group, dir_path / f"{year.strftime('%Y')}.png")
+        for year, group in conv_set.group_by_year().items()
+    ]
+
+    pending: set[Future[None]] = set()
+    with ThreadPoolExecutor(max_workers=_MAX_SAVE_WORKERS) as executor:
+        for tasks, description in (
+            (weekly, "Creating weekly wordclouds 🔡☁️ "),
+            (monthly, "Creating monthly wordclouds 🔡☁️ "),
+            (yearly, "Creating yearly wordclouds 🔡☁️ "),
+        ):
+            with tqdm(
+                total=len(tasks),
+                desc=description,
+                disable=not progress_bar,
+                mininterval=_PROGRESS_MININTERVAL,
+            ) as pbar:
+                for group, filepath in tasks:
+                    _submit_save(
+                        executor,
+                        pending,
+                        group.wordcloud(**kwargs).save,
+                        filepath,
+                        optimize=True,
+                    )
+                    pbar.update(1)
+
+    for future in pending:
+        future.result()
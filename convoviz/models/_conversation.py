@@ -6,7 +6,7 @@ object path : conversations.json -> conversation (one of the list items)
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from os import utime as os_utime
+from os import sep, supports_fd, utime as os_utime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -26,12 +26,36 @@ from convoviz.utils import (
 from ._node import Node
 
 if TYPE_CHECKING:
+    from io import BufferedWriter
+
     from PIL.Image import Image
     from typing_extensions import Unpack
 
     from ._message import AuthorRole
 
 
+def _create_file(filepath: Path) -> tuple[BufferedWriter, Path]:
+    """Create and open a new file, adding a counter to the name if it's taken.
+
+    `x` mode fails on an existing file, so there's no separate `exists` check
+    (`ConversationSet.save` already picks free names, conflicts are rare).
+    """
+    try:
+        return filepath.open("xb"), filepath
+    except FileExistsError:
+        pass
+
+    # candidates are plain strings, only the free one is made a `Path`
+    base = f"{filepath.parent}{sep}{sanitize(filepath.stem)}"
+    counter = 1
+    while True:
+        candidate = f"{base} ({counter}){filepath.suffix}"
+        try:
+            return open(candidate, "xb"), Path(candidate)  # noqa: PTH123, SIM115
+        except FileExistsError:
+            counter += 1
+
+
 class Conversation(BaseModel):
     """Wrapper class for a `conversation` in _a_ `json` file."""
 
@@ -48,6 +72,11 @@ class Conversation(BaseModel):
     conversation_template_id: str | None = None
     id: str | None = None  # noqa: A003
 
+    @classmethod
+    def configs(cls) -> ConversationConfigs:
+        """Get the configuration for all conversations."""
+        return cls.__configs
+
     @classmethod
     def update_configs(cls, configs: ConversationConfigs) -> None:
         """Set the configuration for all conversations."""
@@ -58,8 +87,7 @@ class Conversation(BaseModel):
         """Load the conversation from a JSON file."""
         filepath = Path(filepath)
 
-        with filepath.open(encoding="utf-8") as file:
-            return cls(**loads(file.read()))
+        return cls(**loads(filepath.read_bytes()))
 
     @property
     def node_mapping(self) -> dict[str, Node]:
@@ -185,7 +213,8 @@ class Conversation(BaseModel):
         markdown_config = self.__configs["markdown"]
         latex_delimiters = markdown_config["latex_delimiters"]
 
-        markdown = self.yaml
+        # joined once at the end, instead of growing (and copying) one big string
+        markdown = [self.yaml]
 
         for node in self._all_message_nodes:
             if node.message:
@@ -194,26 +223,27 @@ class Conversation(BaseModel):
                 content = f"\n{content}\n" if content else ""
                 if latex_delimiters == "dollars":
                     content = replace_latex_delimiters(content)
-                markdown += f"\n{node.header}{content}{node.footer}\n---\n"
+                markdown.append(f"\n{node.header}{content}{node.footer}\n---\n")
 
-        return markdown
+        return "".join(markdown)
 
     def save(self, filepath: Path | str) -> None:
         """Save the conversation to the file, with added modification time."""
         filepath = Path(filepath)
-        base_file_name = sanitize(filepath.stem)
+        markdown = self.markdown.encode("utf-8")
 
-        counter = 0
-        while filepath.exists():
-            counter += 1
-            filepath = filepath.with_name(
-                f"{base_file_name} ({counter}){filepath.suffix}",
-            )
+        file, filepath = _create_file(filepath)
+        times = (self.update_time.timestamp(), self.update_time.timestamp())
 
-        with filepath.open("w", encoding="utf-8") as file:
-            file.write(self.markdown)
+        with file:
+            file.write(markdown)
+            if os_utime in supports_fd:
+                # flushed first, so closing the file doesn't bump the mtime again
+                file.flush()
+                os_utime(file.fileno(), times)
 
-        os_utime(filepath, (self.update_time.timestamp(), self.update_time.timestamp()))
+        if os_utime not in supports_fd:
+            os_utime(filepath, times)
 
     def timestamps(
         self,
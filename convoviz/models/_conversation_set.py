@@ -5,35 +5,226 @@ Groups conversations by week, month, and year, etc.
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from mmap import ACCESS_READ, mmap
+from operator import attrgetter
+from os import cpu_count, fstat, listdir
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from re import compile as re_compile
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal
 
-from orjson import OPT_INDENT_2, dumps, loads
-from pydantic import BaseModel
+from orjson import OPT_APPEND_NEWLINE, OPT_INDENT_2, dumps, loads
+from pydantic import BaseModel, PrivateAttr
 from tqdm import tqdm
 
 from convoviz.data_analysis import generate_week_barplot, generate_wordcloud
 from convoviz.utils import get_archive, sanitize
 
-from ._conversation import Conversation  # noqa: TCH001
+from ._conversation import Conversation
+from ._message import Message
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from datetime import datetime
 
     from matplotlib.figure import Figure
     from PIL.Image import Image
     from typing_extensions import Unpack
 
-    from convoviz.utils import GraphKwargs, WordCloudKwargs
+    from convoviz.utils import (
+        ConversationConfigs,
+        GraphKwargs,
+        MessageConfigs,
+        WordCloudKwargs,
+    )
 
     from ._message import AuthorRole
 
+_MMAP_THRESHOLD = 64 * 1024 * 1024  # bytes
+_STREAM_THRESHOLD = 512 * 1024 * 1024  # bytes
+_STREAM_CHUNK_SIZE = 4 * 1024 * 1024  # bytes
+# fewer conversations than this are saved in the calling process
+_MIN_PARALLEL_SAVES = 1000
+
+# a run of anything but brackets, including whole strings without escapes (so
+# brackets inside them are skipped by the regex engine), a bracket, or a lone quote,
+# for a string with escapes or one that's cut off at the end of the chunk. The string
+# body is matched in a lookahead and consumed with a backreference (an atomic group),
+# so a string that doesn't match fails without backtracking through it.
+_JSON_TOKEN = re_compile(rb'(?:[^][{}"]+|"(?=([^"\\]*))\1")+|[][{}]|"')
+# anything between the elements of the top-level array, other than separators
+_JSON_ARRAY_ITEM = re_compile(rb"[^\s,]")
+_BACKSLASH = ord("\\")
+
+
+def _backslashes_before(chunk: bytes, end: int, start: int) -> int:
+    """Count the backslashes right before `end` in the chunk, not before `start`."""
+    pos = end
+    while pos > start and chunk[pos - 1] == _BACKSLASH:
+        pos -= 1
+    return end - pos
+
+
+class _JSONArraySplitter:
+    """Split a top-level JSON array, read in chunks, into its parsed elements.
+
+    The scanning state (depth, inside a string, after a backslash) is kept between
+    chunks, so every byte is scanned once, and the parts of an element spanning
+    several chunks are joined only once it's complete.
+    """
+
+    def __init__(self) -> None:
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._parts: list[bytes] = []  # the current element, from previous chunks
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Scan the chunk, and return the elements completed in it."""
+        items: list[Any] = []
+        size = len(chunk)
+        pos = self._skip_string(chunk, 0) if self._in_string else 0
+        start: int | None = 0 if self._parts else None
+
+        while pos < size:
+            if self._depth < 2:  # noqa: PLR2004
+                match = _JSON_ARRAY_ITEM.search(chunk, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                if self._enter(match[0]):
+                    start = match.start()
+                continue
+
+            pos = self._scan_element(chunk, pos)
+            if self._depth == 1:
+                items.append(self._element(chunk, start, pos))
+                start = None
+
+        if start is not None:
+            self._parts.append(chunk[start:])
+        return items
+
+    def _scan_element(self, chunk: bytes, pos: int) -> int:
+        """Scan an element until it ends or the chunk does, return where it stopped."""
+        size = len(chunk)
+        while pos < size:
+            for match in _JSON_TOKEN.finditer(chunk, pos):
+                token = match[0]
+                if token == b'"':
+                    self._in_string = True
+                    pos = self._skip_string(chunk, match.end())
+                    break  # resume the scan after the string
+                if token in (b"[", b"{"):
+                    self._depth += 1
+                elif token in (b"]", b"}"):
+                    self._depth -= 1
+                    if self._depth == 1:
+                        return match.end()
+            else:
+                return size
+        return pos
+
+    def close(self) -> None:
+        """Check that the whole array was read."""
+        if not self._started or self._depth or self._in_string:
+            err_msg = "Unexpected end of the JSON array"
+            raise ValueError(err_msg)
+
+    def _enter(self, byte: bytes) -> bool:
+        """Handle a byte outside the elements, return True if it starts an element."""
+        if self._depth == 0:
+            if byte != b"[" or self._started:
+                err_msg = "Expected a single JSON array at the top level"
+                raise ValueError(err_msg)
+            self._started = True
+            self._depth = 1
+            return False
+        if byte == b"]":
+            self._depth = 0
+            return False
+        if byte not in (b"{", b"["):
+            err_msg = f"Expected only objects or arrays in the JSON array, got {byte!r}"
+            raise ValueError(err_msg)
+        self._depth = 2
+        return True
+
+    def _skip_string(self, chunk: bytes, pos: int) -> int:
+        """Skip the rest of the string the scan is in, return where to resume."""
+        size = len(chunk)
+        if self._escaped:
+            self._escaped = False
+            pos += 1
+
+        # `bytes.find` (memchr) for the closing quote, it's escaped if it follows an
+        # odd number of backslashes
+        while (quote := chunk.find(b'"', pos)) >= 0:
+            if _backslashes_before(chunk, quote, pos) % 2 == 0:
+                self._in_string = False
+                return quote + 1
+            pos = quote + 1
+
+        # a trailing backslash escapes the first byte of the next chunk
+        self._escaped = _backslashes_before(chunk, size, pos) % 2 == 1
+        return size
+
+    def _element(self, chunk: bytes, start: int | None, end: int) -> Any:  # noqa: ANN401
+        """Parse the element ending at `end` in the chunk."""
+        if not self._parts:
+            return loads(memoryview(chunk)[start:end])
+        self._parts.append(chunk[:end])
+        element = b"".join(self._parts)
+        self._parts.clear()
+        return loads(element)
+
+
+def _iter_json_array(
+    file: BinaryIO,
+    chunk_size: int = _STREAM_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """Parse the elements (objects or arrays) of a top-level JSON array, one at a time.
+
+    Only the element being parsed and the current chunk are held in memory.
+    """
+    splitter = _JSONArraySplitter()
+    while chunk := file.read(chunk_size):
+        yield from splitter.feed(chunk)
+    splitter.close()
+
+
+def _init_worker(
+    message_configs: MessageConfigs,
+    conversation_configs: ConversationConfigs,
+) -> None:
+    """Apply the parent's configs, for worker processes that don't inherit them."""
+    Message.update_configs(message_configs)
+    Conversation.update_configs(conversation_configs)
+
+
+def _save_conversation(conversation: Conversation, filepath: Path) -> None:
+    """Save the conversation to the file (picklable, for worker processes)."""
+    conversation.save(filepath)
+
 
 class ConversationSet(BaseModel):
     """Stores a set of conversations."""
 
     array: list[Conversation]
 
+    # `group_by_*` results, by period, and the length of `array` they were made from
+    _groups: dict[str, dict[datetime, ConversationSet]] = PrivateAttr(
+        default_factory=dict,
+    )
+    _groups_len: int = PrivateAttr(default=-1)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Set the attribute, dropping the cached groups if `array` is replaced."""
+        if name == "array":
+            self._groups.clear()
+        super().__setattr__(name, value)
+
     @property
     def index(self) -> dict[str, Conversation]:
         """Get the index of conversations."""
@@ -41,10 +232,29 @@ class ConversationSet(BaseModel):
 
     @classmethod
     def from_json(cls, filepath: Path | str) -> ConversationSet:
-        """Load from a JSON file, containing an array of conversations."""
+        """Load from a JSON file, containing an array of conversations.
+
+        Large files are memory-mapped, so they aren't copied into a `bytes` object.
+        Very large files are parsed one conversation at a time, so the whole JSON
+        document is never in memory at once.
+        """
         filepath = Path(filepath)
-        with filepath.open(encoding="utf-8") as file:
-            return cls(array=loads(file.read()))
+        with filepath.open("rb") as file:
+            size = fstat(file.fileno()).st_size
+            if size < _MMAP_THRESHOLD:
+                return cls(array=loads(file.read()))
+
+            if size >= _STREAM_THRESHOLD:
+                return cls(
+                    array=[Conversation(**item) for item in _iter_json_array(file)],
+                )
+
+            with mmap(file.fileno(), 0, access=ACCESS_READ) as mapped, memoryview(
+                mapped,
+            ) as view:
+                array = loads(view)
+
+        return cls(array=array)
 
     @classmethod
     def from_zip(cls, filepath: Path | str) -> ConversationSet:
@@ -66,18 +276,75 @@ class ConversationSet(BaseModel):
         self.index.update(conv_set.index)
         self.array = list(self.index.values())
 
+    def _unique_filepaths(self, dir_path: Path) -> list[Path]:
+        """File paths to save the conversations to, without any name conflicts.
+
+        Names are compared case-insensitively, for case-insensitive file systems.
+        """
+        taken = {name.casefold() for name in listdir(dir_path)}
+        # last counter used per name, so repeated titles don't re-probe from (1)
+        counters: dict[str, int] = {}
+        filepaths: list[Path] = []
+
+        for conversation in self.array:
+            filename = sanitize(f"{conversation.title}.md")
+            base_file_name, suffix = Path(filename).stem, Path(filename).suffix
+            key = filename.casefold()
+
+            counter = counters.get(key, 0)
+            if counter:
+                filename = f"{base_file_name} ({counter}){suffix}"
+            while filename.casefold() in taken:
+                counter += 1
+                filename = f"{base_file_name} ({counter}){suffix}"
+
+            counters[key] = counter
+            taken.add(filename.casefold())
+            filepaths.append(dir_path / filename)
+
+        return filepaths
+
     def save(self, dir_path: Path | str, *, progress_bar: bool = False) -> None:
-        """Save the conversation set to the directory."""
+        """Save the conversation set to the directory.
+
+        Large sets are rendered and written in parallel, in worker processes.
+        """
         dir_path = Path(dir_path)
         dir_path.mkdir(parents=True, exist_ok=True)
 
-        for conversation in tqdm(
-            self.array,
-            "Writing Markdown 📄 files",
-            disable=not progress_bar,
-        ):
-            filepath = dir_path / sanitize(f"{conversation.title}.md")
-            conversation.save(filepath)
+        # names are decided here, so the workers never race for the same file
+        filepaths = self._unique_filepaths(dir_path)
+
+        max_workers = cpu_count() or 1
+        saved: Iterable[None]
+
+        with ExitStack() as stack:
+            # starting the workers and pickling the conversations over to them costs
+            # more than it saves with a single CPU, or only a few conversations
+            if max_workers == 1 or len(self.array) < _MIN_PARALLEL_SAVES:
+                saved = map(_save_conversation, self.array, filepaths)
+            else:
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        initializer=_init_worker,
+                        initargs=(Message.configs(), Conversation.configs()),
+                    ),
+                )
+                saved = executor.map(
+                    _save_conversation,
+                    self.array,
+                    filepaths,
+                    chunksize=max(1, len(self.array) // (max_workers * 4)),
+                )
+
+            for _ in tqdm(
+                saved,
+                "Writing Markdown 📄 files",
+                total=len(self.array),
+                disable=not progress_bar,
+            ):
+                pass
 
     @property
     def custom_instructions(self) -> list[dict[str, Any]]:
@@ -102,8 +369,9 @@ class ConversationSet(BaseModel):
     def save_custom_instructions(self, filepath: Path | str) -> None:
         """Save the custom instructions to the file."""
         filepath = Path(filepath)
-        with filepath.open("w", encoding="utf-8") as file:
-            file.write(dumps(self.custom_instructions, option=OPT_INDENT_2).decode())
+        filepath.write_bytes(
+            dumps(self.custom_instructions, option=OPT_INDENT_2 | OPT_APPEND_NEWLINE),
+        )
 
     def timestamps(
         self,
@@ -154,38 +422,42 @@ class ConversationSet(BaseModel):
         self.index[conv.conversation_id] = conv
         self.array.append(conv)
 
-    def group_by_week(self) -> dict[datetime, ConversationSet]:
-        """Get a dictionary of conversations grouped by the start of the week."""
+    def _group_by(
+        self,
+        period: Literal["week", "month", "year"],
+    ) -> dict[datetime, ConversationSet]:
+        """Get a dictionary of conversations grouped by the start of the period.
+
+        Cached until `array` is replaced or its length changes (`add`, `update`,
+        `append`, ...). Replacing items of `array` in place isn't detected, so
+        reassign `array` instead.
+        """
+        if len(self.array) != self._groups_len:
+            self._groups.clear()
+            self._groups_len = len(self.array)
+        elif period in self._groups:
+            return self._groups[period]
+
         grouped: dict[datetime, ConversationSet] = {}
+        period_start = attrgetter(f"{period}_start")
 
         for conversation in self.array:
-            week_start = conversation.week_start
-            if week_start not in grouped:
-                grouped[week_start] = ConversationSet(array=[])
-            grouped[week_start].add(conversation)
+            start = period_start(conversation)
+            if start not in grouped:
+                grouped[start] = ConversationSet(array=[])
+            grouped[start].add(conversation)
 
+        self._groups[period] = grouped
         return grouped
 
+    def group_by_week(self) -> dict[datetime, ConversationSet]:
+        """Get a dictionary of conversations grouped by the start of the week."""
+        return self._group_by("week")
+
     def group_by_month(self) -> dict[datetime, ConversationSet]:
         """Get a dictionary of conversations grouped by the start of the month."""
-        grouped: dict[datetime, ConversationSet] = {}
-
-        for conversation in self.array:
-            month_start = conversation.month_start
-            if month_start not in grouped:
-                grouped[month_start] = ConversationSet(array=[])
-            grouped[month_start].add(conversation)
-
-        return grouped
+        return self._group_by("month")
 
     def group_by_year(self) -> dict[datetime, ConversationSet]:
         """Get a dictionary of conversations grouped by the start of the year."""
-        grouped: dict[datetime, ConversationSet] = {}
-
-        for conversation in self.array:
-            year_start = conversation.year_start
-            if year_start not in grouped:
-                grouped[year_start] = ConversationSet(array=[])
-            grouped[year_start].add(conversation)
-
-        return grouped
+        return self._group_by("year")
@@ -9,7 +9,12 @@ from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from pydantic import BaseModel, ConfigDict
 
-from convoviz.utils import DEFAULT_MESSAGE_CONFIGS, MessageConfigs, code_block
+from convoviz.utils import (
+    DEFAULT_MESSAGE_CONFIGS,
+    AuthorHeaders,
+    MessageConfigs,
+    code_block,
+)
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -52,6 +57,7 @@ class Message(BaseModel):
     """
 
     __configs: ClassVar[MessageConfigs] = DEFAULT_MESSAGE_CONFIGS
+    __author_headers: ClassVar[AuthorHeaders] = __configs["author_headers"]
 
     id: str  # noqa: A003
     author: MessageAuthor
@@ -64,15 +70,21 @@ class Message(BaseModel):
     metadata: MessageMetadata
     recipient: str
 
+    @classmethod
+    def configs(cls) -> MessageConfigs:
+        """Get the configuration for all messages."""
+        return cls.__configs
+
     @classmethod
     def update_configs(cls, configs: MessageConfigs) -> None:
         """Set the configuration for all messages."""
         cls.__configs.update(configs)
+        cls.__author_headers = cls.__configs["author_headers"]
 
     @property
     def header(self) -> str:
         """Get the title header of the message based on the configs."""
-        return self.__configs["author_headers"][self.author.role]
+        return self.__author_headers[self.author.role]
 
     @property
     def text(self) -> str:
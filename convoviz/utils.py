@@ -2,41 +2,82 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from itertools import repeat
+from os import DirEntry, cpu_count, scandir, sep
+from os.path import normpath
 from pathlib import Path
 from re import compile as re_compile
-from re import sub as re_sub
+from shutil import copyfileobj
+from stat import S_ISREG
 from typing import Any, Literal, TypedDict
-from zipfile import ZipFile
+from zipfile import BadZipFile, ZipFile, ZipInfo
 
 DOWNLOADS = Path.home() / "Downloads"
 
+# each worker parses the central directory again, so no more than the CPUs
+_MAX_EXTRACT_WORKERS = cpu_count() or 1
+_EXTRACT_BUFFER_SIZE = 1 << 17  # bytes
+
+
+def _downloads_files(suffix: str) -> list[DirEntry[str]]:
+    """Files in the Downloads folder with the given suffix.
+
+    `DirEntry` objects cache their `stat` result, so it's only fetched once per file.
+    """
+    try:
+        with scandir(DOWNLOADS) as entries:
+            return [x for x in entries if x.name.endswith(suffix) and x.is_file()]
+    except FileNotFoundError:
+        return []
+
 
 def latest_zip() -> Path:
-    """Path to the most recently created zip file in the Downloads folder."""
-    zip_files = list(DOWNLOADS.glob("*.zip"))
+    """Path to the most recently created zip file in the Downloads folder.
+
+    The most recent zip that is a valid export is preferred. Candidates are checked
+    newest first, so usually only one zip gets opened.
+    """
+    zip_files = [
+        Path(x.path)
+        for x in sorted(
+            _downloads_files(".zip"),
+            key=lambda x: x.stat().st_ctime,
+            reverse=True,
+        )
+    ]
 
     if not zip_files:
         err_msg = f"No zip files found in {DOWNLOADS}"
         raise FileNotFoundError(err_msg)
 
-    return max(zip_files, key=lambda x: x.stat().st_ctime)
+    return next((x for x in zip_files if validate_zip(x)), zip_files[0])
 
 
 def latest_bookmarklet_json() -> Path | None:
     """Path to the most recent JSON file in Downloads with 'bookmarklet' in the name."""
-    bkmrklet_files = [x for x in DOWNLOADS.glob("*.json") if "bookmarklet" in x.name]
+    latest: DirEntry[str] | None = None
+    latest_ctime = float("-inf")
+
+    # single pass, comparing each file's (cached) ctime only once
+    for entry in _downloads_files(".json"):
+        if "bookmarklet" not in entry.name:
+            continue
+        ctime = entry.stat().st_ctime
+        if ctime > latest_ctime:
+            latest, latest_ctime = entry, ctime
+
+    return Path(latest.path) if latest else None
 
-    if not bkmrklet_files:
-        return None
 
-    return max(bkmrklet_files, key=lambda x: x.stat().st_ctime)
+_FILENAME_ANTI_PATTERN = re_compile(r'[<>:"/\\|?*\n\r\t\f\v]+')
 
 
+@lru_cache(maxsize=4096)
 def sanitize(filename: str) -> str:
     """Sanitized title of the conversation, compatible with file names."""
-    anti_pattern = re_compile(r'[<>:"/\\|?*\n\r\t\f\v]+')
-
-    return anti_pattern.sub("_", filename.strip()) or "untitled"
+    return _FILENAME_ANTI_PATTERN.sub("_", filename.strip()) or "untitled"
 
 
 def close_code_blocks(text: str) -> str:
@@ -62,13 +103,19 @@ def close_code_blocks(text: str) -> str:
     return text
 
 
+_LATEX_DISPLAY_DELIMITER = re_compile(r"\\[\[\]]")
+_LATEX_INLINE_DELIMITER = re_compile(r"\\[()]")
+
+
 def replace_latex_delimiters(text: str) -> str:
     """Replace all the LaTeX bracket delimiters in the string with dollar sign ones."""
-    text = re_sub(r"\\\[", "$$", text)
-    text = re_sub(r"\\\]", "$$", text)
-    text = re_sub(r"\\\(", "$", text)
+    # every delimiter starts with a backslash, most messages have none
+    if "\\" not in text:
+        return text
 
-    return re_sub(r"\\\)", "$", text)
+    text = _LATEX_DISPLAY_DELIMITER.sub("$$", text)
+
+    return _LATEX_INLINE_DELIMITER.sub("$", text)
 
 
 def stem(path: Path | str) -> str:
@@ -84,10 +131,11 @@ def root_dir() -> Path:
     return Path(__file__).parent
 
 
-def font_names() -> list[str]:
-    """List of font names in the `assets/fonts` folder."""
+@cache
+def font_names() -> tuple[str, ...]:
+    """Font names in the `assets/fonts` folder."""
     fonts_path = root_dir() / "assets" / "fonts"
-    return [font.stem for font in fonts_path.iterdir()]
+    return tuple(font.stem for font in fonts_path.iterdir())
 
 
 def font_path(font_name: str) -> Path:
@@ -98,46 +146,164 @@ def font_path(font_name: str) -> Path:
     return root_dir() / "assets" / "fonts" / f"{font_name}.ttf"
 
 
+@cache
 def default_font_path() -> Path:
     """Path to the default font in the `assets/fonts` folder."""
     return font_path("RobotoSlab-Thin")
 
 
-def colormaps() -> list[str]:
-    """List of colormaps in the `assets/colormaps.txt` file."""
+@cache
+def colormaps() -> tuple[str, ...]:
+    """Colormaps in the `assets/colormaps.txt` file."""
     colormaps_path = root_dir() / "assets" / "colormaps.txt"
     with colormaps_path.open(encoding="utf-8") as file:
-        return file.read().splitlines()
+        return tuple(file.read().splitlines())
 
 
+@lru_cache(maxsize=128)
 def validate_header(text: str) -> bool:
     """Return True if the given text is a valid markdown header."""
     max_header_level = 6
     return (
         1 <= text.count("#") <= max_header_level
         and text.startswith("#")
-        and text[len(text.split()[0])] == " "
+        # slice instead of index, so a bare "#" (still being typed) isn't an error
+        and text[len(text.split()[0]) :].startswith(" ")
     )
 
 
 def validate_zip(filepath: str | Path) -> bool:
     """Return True if the given path is a zip file with a `conversations.json` file."""
     filepath = Path(filepath)
-    if not filepath.is_file() or filepath.suffix != ".zip":
+    if filepath.suffix != ".zip":
+        return False
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return False
+    if not S_ISREG(stat.st_mode):
+        return False
+    return _zip_has_conversations(filepath, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=128)
+def _zip_has_conversations(
+    filepath: Path,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+) -> bool:
+    """Return True if the zip contains a `conversations.json` file.
+
+    `mtime_ns` and `size` are only part of the cache key, so that a zip that
+    changed on disk gets opened again.
+    """
+    try:
+        with ZipFile(filepath) as zip_ref:
+            return "conversations.json" in zip_ref.namelist()
+    except (BadZipFile, OSError):  # e.g. a zip in Downloads we can't read
         return False
-    with ZipFile(filepath) as zip_ref:
-        if "conversations.json" in zip_ref.namelist():
-            return True
-    return False
+
+
+# absolute path, drive letter, first component ending with ":", or a ".." component
+_UNSAFE_ZIP_MEMBER_NAME = re_compile(r"^/|^[A-Za-z]:|^[^/]*:(?:/|$)|(?:^|/)\.\.(?:/|$)")
+
+
+def _is_safe_zip_member_name(name: str) -> bool:
+    """Return True if the zip member name stays inside the extraction folder."""
+    return not _UNSAFE_ZIP_MEMBER_NAME.search(name.replace("\\", "/"))
+
+
+# characters `zipfile` replaces in member names when extracting on Windows
+_WINDOWS_ILLEGAL_NAME_CHARS = str.maketrans(':<>|"?*', "_" * 7)
+
+
+def _windows_safe_name(name: str) -> str:
+    """Member name with the characters illegal on Windows replaced, like `zipfile`.
+
+    Trailing dots are also dropped from each part, as Windows would.
+    """
+    parts = (
+        part.rstrip(".")
+        for part in name.translate(_WINDOWS_ILLEGAL_NAME_CHARS).split("/")
+    )
+    return "/".join(part for part in parts if part)
+
+
+def _extract_members(file: ZipFile, members: list[tuple[ZipInfo, str]]) -> None:
+    """Extract the members to their (already checked) targets."""
+    for member, target in members:
+        # `open` on the plain string, no `Path` object per member
+        with file.open(member) as source, open(target, "wb") as destination:  # noqa: PTH123
+            copyfileobj(source, destination, _EXTRACT_BUFFER_SIZE)
+
+
+def _extract_members_in_worker(
+    filepath: Path,
+    members: list[tuple[ZipInfo, str]],
+) -> None:
+    """Extract the members, with a `ZipFile` handle of the worker's own."""
+    with ZipFile(filepath) as file:
+        _extract_members(file, members)
 
 
 def get_archive(filepath: Path | str) -> Path:
-    """Extract the zip and return the path to the extracted folder."""
+    """Extract the zip and return the path to the extracted folder.
+
+    Every member is checked (zip slip) before anything is written, then the members
+    are extracted, concurrently with several CPUs (each worker reading from its own
+    `ZipFile` handle), and copied with a larger buffer than `ZipFile.extract` uses.
+    """
     filepath = Path(filepath)
     folder = filepath.with_suffix("")
 
+    # `zipfile` never extracts symlinks, so a normalized path string is enough to
+    # check that a member stays inside the folder, without `resolve` syscalls
+    base = str(folder.resolve())
+    base_prefix = f"{base}{sep}"
+
     with ZipFile(filepath) as file:
-        file.extractall(folder)
+        directories = {base}
+        # by target: for duplicate names, the last member wins (like `extractall`),
+        # and no two workers ever write the same file
+        files: dict[str, ZipInfo] = {}
+        for member in file.infolist():
+            name = member.filename
+            if not _is_safe_zip_member_name(name):
+                err_msg = f"Unsafe path in zip file: {name}"
+                raise ValueError(err_msg)
+            if sep == "\\":
+                # e.g. "10:00.png" would otherwise be an NTFS alternate data stream
+                name = _windows_safe_name(name)
+            target = normpath(f"{base_prefix}{name}")
+            if not (target == base or target.startswith(base_prefix)):
+                err_msg = f"Unsafe path in zip file: {member.filename}"
+                raise ValueError(err_msg)
+            if member.is_dir():
+                directories.add(target)
+            else:
+                directories.add(target.rpartition(sep)[0])
+                files[target] = member
+
+        # created upfront, so the workers don't race each other on `makedirs`
+        for directory in directories:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+
+        items = [(member, target) for target, member in files.items()]
+        worker_count = min(_MAX_EXTRACT_WORKERS, len(items))
+        if worker_count <= 1:
+            # no second parse of the central directory, for a worker's own handle
+            _extract_members(file, items)
+            return folder
+
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        # `list` to re-raise any exception from the workers
+        list(
+            executor.map(
+                _extract_members_in_worker,
+                repeat(filepath),
+                [items[i::worker_count] for i in range(worker_count)],
+            ),
+        )
 
     return folder
 
@@ -263,7 +429,8 @@ class AllConfigs(TypedDict):
 
 
 DEFAULT_USER_CONFIGS: AllConfigs = {
-    "zip_filepath": str(latest_zip()),
+    # set when `UserConfigs` is created, not at import (it may open the zips found)
+    "zip_filepath": "",
     "output_folder": str(Path.home() / "Documents" / "ChatGPT Data"),
     "message": DEFAULT_MESSAGE_CONFIGS,
     "conversation": DEFAULT_CONVERSATION_CONFIGS,
@@ -0,0 +1,125 @@
+"""Tests for the ConversationSet class."""
+
+# pyright: reportUnknownVariableType=false
+# pyright: reportGeneralTypeIssues=false
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import pytest
+from orjson import dumps
+
+from convoviz.models import Conversation, ConversationSet
+from convoviz.models._conversation_set import _iter_json_array
+
+from .mocks import CONVERSATION_111, DATETIME_112, TITLE_111, USER_MESSAGE_TEXT_111
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_save(tmp_path: Path) -> None:
+    """Test save method, with conflicting titles."""
+    conv_set = ConversationSet(
+        array=[
+            CONVERSATION_111,
+            {**CONVERSATION_111, "conversation_id": "conversation_112"},
+            {**CONVERSATION_111, "conversation_id": "conversation_113"},
+        ],
+    )
+
+    conv_set.save(tmp_path)
+
+    filepaths = sorted(tmp_path.iterdir())
+    assert [filepath.name for filepath in filepaths] == [
+        f"{TITLE_111} (1).md",
+        f"{TITLE_111} (2).md",
+        f"{TITLE_111}.md",
+    ]
+    for filepath in filepaths:
+        assert USER_MESSAGE_TEXT_111 in filepath.read_text(encoding="utf-8")
+        assert filepath.stat().st_mtime == DATETIME_112.timestamp()
+
+
+def test_group_by_month() -> None:
+    """Test group_by_month method, cached until a conversation is added."""
+    conv_set = ConversationSet(array=[CONVERSATION_111])
+
+    groups = conv_set.group_by_month()
+    assert conv_set.group_by_month() is groups
+    assert [len(group.array) for group in groups.values()] == [1]
+
+    conv_set.add(
+        Conversation(
+            **{
+                **CONVERSATION_111,
+                "conversation_id": "conversation_112",
+                "create_time": DATETIME_112.timestamp() + 31 * 24 * 3600,
+            },
+        ),
+    )
+
+    assert len(conv_set.group_by_month()) == 2  # noqa: PLR2004
+
+
+def test_group_by_month_array_changed() -> None:
+    """Test group_by_month method, not cached after `array` is changed directly."""
+    conv_set = ConversationSet(array=[CONVERSATION_111])
+    conversation_112 = Conversation(
+        **{
+            **CONVERSATION_111,
+            "conversation_id": "conversation_112",
+            "create_time": DATETIME_112.timestamp() + 31 * 24 * 3600,
+        },
+    )
+
+    assert len(conv_set.group_by_month()) == 1
+    conv_set.array.append(conversation_112)
+    assert len(conv_set.group_by_month()) == 2  # noqa: PLR2004
+
+    conv_set.array = [conversation_112, conversation_112]  # same length
+    assert len(conv_set.group_by_month()) == 1
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_iter_json_array(chunk_size: int) -> None:
+    """Test _iter_json_array function, with elements cut at every chunk boundary."""
+    array = [
+        CONVERSATION_111,
+        {"text": 'brackets ] } [ { and "quotes" \\" in strings', "nested": [[{}]]},
+        {},
+        [1, "]"],
+    ]
+    file = BytesIO(b" \n" + dumps(array) + b"\n")
+
+    assert list(_iter_json_array(file, chunk_size)) == array
+
+
+def test_iter_json_array_long_element() -> None:
+    """Test _iter_json_array function, with a string and elements spanning chunks."""
+    array = [
+        {"text": 'a\\"]}' * 3000, "list": [{"n": i} for i in range(1000)]},
+        {"text": "b"},
+    ]
+    file = BytesIO(dumps(array))
+
+    assert list(_iter_json_array(file, 1024)) == array
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b'{"a": []}',
+        b'[{"a": 1}, {"b": ',
+        b'[{"a": 1}, "b"',
+        b'[{"a": 1}, 5]',
+        b"[{}] []",
+        b"",
+    ],
+)
+def test_iter_json_array_invalid(data: bytes) -> None:
+    """Test _iter_json_array function, with invalid or truncated arrays."""
+    with pytest.raises(ValueError, match="JSON array"):
+        list(_iter_json_array(BytesIO(data), 4))
@@ -31,6 +31,9 @@ def test_content_text() -> None:
 
     assert assistant_message.text == "assistant message 111"
 
+    # reading the text doesn't change the model's state
+    assert user_message == Message(**USER_MESSAGE_111)
+
 
 def test_content_type() -> None:
     """Test content_type method."""
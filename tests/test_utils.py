@@ -0,0 +1,145 @@
+"""Tests for the utility functions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from zipfile import ZipFile
+
+import pytest
+
+from convoviz.utils import (
+    _is_safe_zip_member_name,
+    _windows_safe_name,
+    get_archive,
+    replace_latex_delimiters,
+    validate_zip,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("conversations.json", True),
+        ("images/file-abc.png", True),
+        ("dir/", True),
+        ("a..b/c", True),
+        ("/etc/passwd", False),
+        ("\\windows\\system32", False),
+        ("C:/windows", False),
+        ("C:windows", False),
+        ("../evil.txt", False),
+        ("dir/../../evil.txt", False),
+        ("dir\\..\\..\\evil.txt", False),
+        ("..", False),
+    ],
+)
+def test_is_safe_zip_member_name(name: str, *, expected: bool) -> None:
+    """Test _is_safe_zip_member_name method."""
+    assert _is_safe_zip_member_name(name) is expected
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("conversations.json", "conversations.json"),
+        ("images/Screenshot 10:00.png", "images/Screenshot 10_00.png"),
+        ('a<b>c|d"e?f*g', "a_b_c_d_e_f_g"),
+        ("dir./file.", "dir/file"),
+        ("dir/", "dir"),
+    ],
+)
+def test_windows_safe_name(name: str, expected: str) -> None:
+    """Test _windows_safe_name function."""
+    assert _windows_safe_name(name) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_get_archive(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    workers: int,
+) -> None:
+    """Test get_archive method, extracting in the calling thread or in workers."""
+    monkeypatch.setattr("convoviz.utils._MAX_EXTRACT_WORKERS", workers)
+    zip_path = tmp_path / "export.zip"
+    with ZipFile(zip_path, "w") as zip_ref:
+        zip_ref.writestr("conversations.json", "[]")
+        zip_ref.writestr("images/file-abc.png", b"png")
+        zip_ref.writestr("empty/", "")
+
+    folder = get_archive(zip_path)
+
+    assert folder == tmp_path / "export"
+    assert (folder / "conversations.json").read_text() == "[]"
+    assert (folder / "images" / "file-abc.png").read_bytes() == b"png"
+    assert (folder / "empty").is_dir()
+
+
+def test_get_archive_duplicate_names(tmp_path: Path) -> None:
+    """Test get_archive method, with the last of the duplicate members winning."""
+    zip_path = tmp_path / "export.zip"
+    with pytest.warns(UserWarning, match="Duplicate name"), ZipFile(
+        zip_path,
+        "w",
+    ) as zip_ref:
+        zip_ref.writestr("conversations.json", "[]")
+        zip_ref.writestr("conversations.json", "[{}]")
+
+    folder = get_archive(zip_path)
+
+    assert (folder / "conversations.json").read_text() == "[{}]"
+
+
+def test_get_archive_zip_slip(tmp_path: Path) -> None:
+    """Test get_archive method with a member escaping the extraction folder."""
+    zip_path = tmp_path / "export.zip"
+    with ZipFile(zip_path, "w") as zip_ref:
+        zip_ref.writestr("conversations.json", "[]")
+        zip_ref.writestr("../evil.txt", "evil")
+
+    with pytest.raises(ValueError, match="Unsafe path"):
+        get_archive(zip_path)
+
+    assert not (tmp_path / "evil.txt").exists()
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("no math here", "no math here"),
+        (r"inline \(x^2\) and", "inline $x^2$ and"),
+        (r"\[\frac{a}{b}\]", r"$$\frac{a}{b}$$"),
+        (r"\\ line break, \alpha", r"\\ line break, \alpha"),
+    ],
+)
+def test_replace_latex_delimiters(text: str, expected: str) -> None:
+    """Test replace_latex_delimiters function."""
+    assert replace_latex_delimiters(text) == expected
+
+
+def test_validate_zip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test validate_zip function."""
+    export_path = tmp_path / "export.zip"
+    with ZipFile(export_path, "w") as zip_ref:
+        zip_ref.writestr("conversations.json", "[]")
+    other_path = tmp_path / "other.zip"
+    with ZipFile(other_path, "w") as zip_ref:
+        zip_ref.writestr("file.txt", "")
+    fake_path = tmp_path / "fake.zip"
+    fake_path.write_bytes(b"not a zip")
+
+    assert validate_zip(export_path)
+    assert not validate_zip(other_path)
+    assert not validate_zip(fake_path)
+    assert not validate_zip(tmp_path / "missing.zip")
+
+    def unreadable(*_: object) -> ZipFile:
+        raise PermissionError
+
+    locked_path = tmp_path / "locked.zip"
+    locked_path.write_bytes(export_path.read_bytes())
+    monkeypatch.setattr("convoviz.utils.ZipFile", unreadable)
+    assert not validate_zip(locked_path)